@@ -1,17 +1,20 @@
 """
 Purpose: Orchestrate AI agent execution with LLM calls, tool execution, and automatic logging
 LLM-Note:
-  Dependencies: imports from [llm.py, tool_factory.py, prompts.py, decorators.py, console.py, tool_executor.py, trust.py] | imported by [__init__.py, trust.py, debug_agent/__init__.py] | tested by [tests/test_agent.py, tests/test_agent_prompts.py, tests/test_agent_workflows.py]
+  Dependencies: imports from [llm.py, tool_factory.py, prompts.py, decorators.py, console.py, tool_executor.py, trust.py, cache.py, tool_cache.py] | imported by [__init__.py, trust.py, debug_agent/__init__.py] | tested by [tests/test_agent.py, tests/test_agent_prompts.py, tests/test_agent_workflows.py]
   Data flow: receives user prompt: str from Agent.input() → creates/extends current_session with messages → calls llm.complete() with tool schemas → receives LLMResponse with tool_calls → executes tools via tool_executor.execute_and_record_tools() → appends tool results to messages → repeats loop until no tool_calls or max_iterations → console logs to .co/logs/{name}.log → returns final response: str
-  State/Effects: modifies self.current_session['messages', 'trace', 'turn', 'iteration'] | writes to .co/logs/{name}.log via console.py (default) or custom log path | initializes trust agent if trust parameter provided
-  Integration: exposes Agent(name, tools, system_prompt, model, trust, log), .input(prompt), .execute_tool(name, args), .add_tool(func), .remove_tool(name), .list_tools(), .reset_conversation() | tools auto-converted via tool_factory.create_tool_from_function() | tool execution delegates to tool_executor module | trust system via trust.create_trust_agent() | log defaults to .co/logs/ (None), can be True (current dir), False (disabled), or custom path
-  Performance: max_iterations=10 default (configurable per-input) | session state persists across turns for multi-turn conversations | tool_map provides O(1) tool lookup by name
+  State/Effects: modifies self.current_session['messages', 'trace', 'turn', 'iteration'] | writes to .co/logs/{name}.log via console.py (default) or custom log path | initializes trust agent if trust parameter provided | reads/writes self.cache when provided (cache hits return without calling the LLM; answers from turns that ran non-cacheable tools are not stored) | self.tool_cache memoizes results of tools marked cacheable
+  Integration: exposes Agent(name, tools, system_prompt, model, trust, log, cache), .input(prompt), .input_batch(prompts), .input_batch_async(prompts), .execute_tool(name, args), .add_tool(func), .remove_tool(name), .list_tools(), .reset_conversation() | tools auto-converted via tool_factory.create_tool_from_function() | tool execution delegates to tool_executor module | trust system via trust.create_trust_agent() | log defaults to .co/logs/ (None), can be True (current dir), False (disabled), or custom path
+  Performance: max_iterations=10 default (configurable per-input) | session state persists across turns for multi-turn conversations | input_batch() runs independent prompts concurrently on shallow copies (own session each) | tool_map provides O(1) tool lookup by name | tool schemas frozen in self._tool_schemas (rebuilt by add_tool/remove_tool only)
   Errors: LLM errors bubble up | tool execution errors captured in trace and returned to LLM for retry | trust agent creation can fail if invalid trust parameter
 """
 
 import os
 import sys
+import copy
 import time
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Dict, Any, Callable, Union
 from pathlib import Path
 from dotenv import load_dotenv
@@ -22,7 +25,9 @@ from .decorators import (
     _is_replay_enabled  # Only need this for replay check
 )
 from .console import Console
-from .tool_executor import execute_and_record_tools, execute_single_tool
+from .tool_executor import execute_and_record_tools, execute_single_tool, _max_tool_workers
+from .cache import SemanticCache, make_namespace
+from .tool_cache import ToolCache
 
 # Load environment variables from .env file
 load_dotenv()
@@ -42,12 +47,19 @@ class Agent:
         model: str = "co/o4-mini",
         max_iterations: int = 10,
         trust: Optional[Union[str, Path, 'Agent']] = None,
-        log: Optional[Union[bool, str, Path]] = None
+        log: Optional[Union[bool, str, Path]] = None,
+        cache: Optional[SemanticCache] = None
     ):
         self.name = name
         self.system_prompt = load_system_prompt(system_prompt)
         self.max_iterations = max_iterations
 
+        # Optional response cache (repeated prompts skip the LLM entirely)
+        self.cache = cache
+
+        # Results of tools marked cacheable are reused for repeated arguments
+        self.tool_cache = ToolCache()
+
         # Current session context (runtime only)
         self.current_session = None
 
@@ -115,15 +127,20 @@ class Agent:
         self.tools = processed_tools
 
         # Initialize LLM
+        self._owns_llm = not llm
         if llm:
             self.llm = llm
         else:
             # Use factory function to create appropriate LLM based on model
             # For co/ models, the JWT token from 'co auth' is used automatically
-            self.llm = create_llm(model=model, api_key=api_key)
+            # prompt_cache_key groups this agent's requests for OpenAI's prompt cache (other providers ignore it)
+            self.llm = create_llm(model=model, api_key=api_key, prompt_cache_key=self._prompt_cache_key())
         
         # Create tool mapping for quick lookup
         self.tool_map = {tool.name: tool for tool in self.tools}
+
+        # Tool schemas sent with every LLM request (rebuilt only when tools change)
+        self._refresh_tool_schemas()
     
     def input(self, prompt: str, max_iterations: Optional[int] = None) -> str:
         """Provide input to the agent and get response.
@@ -146,6 +163,9 @@ class Agent:
                 'turn': 0  # Track conversation turns
             }
 
+        # Cache key context must be captured before this prompt joins the conversation
+        cache_namespace = self._cache_namespace() if self.cache is not None else None
+
         # Add user message to conversation
         self.current_session['messages'].append({
             "role": "user",
@@ -165,18 +185,118 @@ class Agent:
             'timestamp': turn_start
         })
 
+        # Serve repeated prompts from cache
+        if self.cache is not None:
+            cached = self.cache.lookup(prompt, cache_namespace)
+            if cached is not None:
+                self.current_session['trace'].append({
+                    'type': 'cache_hit',
+                    'turn': self.current_session['turn'],
+                    'timestamp': time.time()
+                })
+                self.console.print(f"[green]✓ Cache hit[/green] ({time.time() - turn_start:.4f}s)")
+                return cached
+
         # Process
         self.current_session['iteration'] = 0  # Reset iteration for this turn
+        trace_start = len(self.current_session['trace'])
         result = self._run_iteration_loop(
             max_iterations or self.max_iterations
         )
 
+        # Only cache completed answers that don't depend on non-cacheable tools (e.g. the current time)
+        if (self.cache is not None and not result.startswith("Task incomplete")
+                and self._turn_is_cacheable(trace_start)):
+            self.cache.put(prompt, result, cache_namespace)
+
         # Calculate duration (console already logged everything)
         duration = time.time() - turn_start
 
         self.console.print(f"[green]✓ Complete[/green] ({duration:.1f}s)")
         return result
 
+    def _prompt_cache_key(self) -> str:
+        """Stable key for the static request prefix, hashed from agent name + system prompt + tool names.
+
+        Provider prompt caches match on prefixes, so every request starts with the same
+        system message and tool list; only conversation messages change between calls.
+        Keep system_prompt static (put per-request details in the user prompt) to benefit.
+        Recomputed by _refresh_tool_schemas() whenever the tool list changes.
+        """
+        return make_namespace(self.name, self.system_prompt, *(tool.name for tool in self.tools))
+
+    def _cache_namespace(self) -> str:
+        """Hash everything besides the prompt that shapes the answer: model, system prompt, tools, prior user turns."""
+        prior_prompts = [
+            msg['content'] for msg in self.current_session['messages']
+            if msg['role'] == 'user' and isinstance(msg.get('content'), str)
+        ]
+        model = str(getattr(self.llm, 'model', ''))
+        return make_namespace(model, self.system_prompt, *sorted(self.tool_map), *prior_prompts)
+
+    def _turn_is_cacheable(self, trace_start: int) -> bool:
+        """True if every tool call since trace_start succeeded and is marked cacheable.
+
+        Answers shaped by a failed call (a transient error) or a non-cacheable tool (e.g. the
+        current time) would be wrong when replayed later.
+        """
+        for entry in self.current_session['trace'][trace_start:]:
+            if entry.get('type') != 'tool_execution':
+                continue
+            if entry.get('status') != 'success':
+                return False
+            tool = self.tool_map.get(entry.get('tool_name'))
+            if tool is None or not getattr(tool, 'cacheable', False):
+                return False
+        return True
+
+    def input_batch(self, prompts: List[str], max_iterations: Optional[int] = None) -> List[str]:
+        """Process independent prompts concurrently, each in its own fresh session.
+
+        Network round-trips overlap, so N prompts take roughly as long as the slowest one.
+        The agent's own conversation (current_session) is left untouched.
+
+        Args:
+            prompts: Independent input prompts
+            max_iterations: Override agent's max_iterations for these requests
+
+        Returns:
+            Responses in the same order as prompts
+        """
+        with ThreadPoolExecutor(max_workers=self._batch_workers(len(prompts))) as pool:
+            return list(pool.map(lambda p: self._fork().input(p, max_iterations), prompts))
+
+    async def input_batch_async(self, prompts: List[str], max_iterations: Optional[int] = None) -> List[str]:
+        """Async version of input_batch() for use inside an event loop.
+
+        Args:
+            prompts: Independent input prompts
+            max_iterations: Override agent's max_iterations for these requests
+
+        Returns:
+            Responses in the same order as prompts
+        """
+        # Same concurrency cap as input_batch() (1 when any tool is not thread-safe)
+        semaphore = asyncio.Semaphore(self._batch_workers(len(prompts)))
+
+        async def run(prompt: str) -> str:
+            async with semaphore:
+                return await asyncio.to_thread(self._fork().input, prompt, max_iterations)
+
+        return list(await asyncio.gather(*(run(p) for p in prompts)))
+
+    def _fork(self) -> 'Agent':
+        """Shallow copy sharing LLM, tools and console, with its own empty session."""
+        fork = copy.copy(self)
+        fork.current_session = None
+        return fork
+
+    def _batch_workers(self, prompt_count: int) -> int:
+        """Run batch prompts one at a time if any tool opts out of concurrent use."""
+        if not all(getattr(tool, 'thread_safe', True) for tool in self.tools):
+            return 1
+        return max(1, min(prompt_count, _max_tool_workers()))
+
     def reset_conversation(self):
         """Reset the conversation session. Start fresh."""
         self.current_session = None
@@ -257,8 +377,8 @@ class Agent:
 
     def _get_llm_decision(self):
         """Get the next action/decision from the LLM."""
-        # Get tool schemas
-        tool_schemas = [tool.to_function_schema() for tool in self.tools] if self.tools else None
+        # Reuse tool schemas built when tools were added
+        tool_schemas = list(self._tool_schemas) if self._tool_schemas else None
 
         # Show request info
         msg_count = len(self.current_session['messages'])
@@ -306,6 +426,7 @@ class Agent:
             
         self.tools.append(processed_tool)
         self.tool_map[processed_tool.name] = processed_tool
+        self._refresh_tool_schemas()
     
     def remove_tool(self, tool_name: str) -> bool:
         """Remove a tool by name."""
@@ -313,9 +434,18 @@ class Agent:
             tool = self.tool_map[tool_name]
             self.tools.remove(tool)
             del self.tool_map[tool_name]
+            self._refresh_tool_schemas()
             return True
         return False
     
+    def _refresh_tool_schemas(self):
+        """Freeze tool schemas once instead of re-serializing them on every LLM call."""
+        self._tool_schemas = tuple(tool.to_function_schema() for tool in self.tools)
+        # The tool list is part of the request prefix, so the prompt cache key must follow it
+        # (only for LLMs this agent created; a caller-supplied llm keeps its own key)
+        if self._owns_llm and hasattr(self.llm, 'prompt_cache_key'):
+            self.llm.prompt_cache_key = self._prompt_cache_key()
+
     def list_tools(self) -> List[str]:
         """List all available tool names."""
         return [tool.name for tool in self.tools]
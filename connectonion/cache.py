@@ -0,0 +1,324 @@
+"""
+Purpose: Cache agent responses so repeated prompts skip the LLM round-trip entirely
+LLM-Note:
+  Dependencies: imports from [hashlib, json, os, tempfile, threading, warnings, collections, pathlib, typing, numpy (optional), orjson (optional), openai (lazy, only for openai_embedder)] | imported by [agent.py, __init__.py] | tested by [tests/unit/test_cache.py]
+  Data flow: Agent.input(prompt) → cache.lookup(prompt, namespace) → exact match in OrderedDict (LRU) → else embed(prompt) → cosine similarity against stored embeddings of same namespace → returns cached response or None | on miss Agent runs the normal loop → cache.put(prompt, response, namespace)
+  State/Effects: keeps entries in memory (OrderedDict + preallocated float32 embedding matrix whose rows are reused after eviction) | writes {path} as .npz after every put when path is set (temp file + os.replace, so readers never see a partial file) | reads {path} on init if it exists | guarded by a lock (safe to share across threads)
+  Integration: exposes SemanticCache(capacity, threshold, embed, path), .lookup(prompt, namespace), .put(prompt, response, namespace), .clear(), .save(), len(cache) | openai_embedder(model, client) returns an embed callable | DEFAULT_CACHE_PATH = ~/.connectonion/cache.npz | namespace isolates entries (Agent uses system prompt + tools + prior conversation)
+  Performance: exact hits are a dict lookup | semantic tier costs one embedding call per new prompt (the vector from a missed lookup is reused by put()) and one BLAS matrix-vector product (gemv) over stored rows, ~60MB / a few ms for 10k x 1536-dim | puts write into a free row instead of copying the matrix | for >100k entries an ANN index (e.g. faiss.IndexFlatIP) is the better fit | LRU eviction keeps memory bounded by capacity | save() re-encodes all entries after every put, so the JSON part uses orjson when installed
+  Errors: semantic tier and persistence are silently disabled when numpy is not installed | embed() errors bubble up | persistence is best-effort: unreadable/corrupt files load as an empty cache and failed writes keep the in-memory cache, both with a RuntimeWarning
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import warnings
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+DEFAULT_CACHE_PATH = Path.home() / ".connectonion" / "cache.npz"
+
+# Embedding rows allocated up front; the matrix doubles (up to capacity) as entries arrive
+_INITIAL_ROWS = 64
+
+# Miss vectors kept for the put() that follows (covers input_batch() running several prompts at once)
+_MISS_VECTORS_MAX = 64
+
+
+def openai_embedder(model: str = "text-embedding-3-small", client=None) -> Callable[[str], List[float]]:
+    """Create an embed function backed by the OpenAI embeddings API.
+
+    Args:
+        model: Embedding model name
+        client: Optional openai.OpenAI client (created lazily from OPENAI_API_KEY if None)
+
+    Returns:
+        Callable that maps a prompt to its embedding vector
+    """
+    state = {"client": client}
+
+    def embed(text: str) -> List[float]:
+        if state["client"] is None:
+            import openai
+            state["client"] = openai.OpenAI()
+        response = state["client"].embeddings.create(model=model, input=text)
+        return response.data[0].embedding
+
+    return embed
+
+
+class SemanticCache:
+    """Two-tier response cache: exact prompt match first, embedding similarity second.
+
+    Usage:
+        cache = SemanticCache()                                  # exact matches only
+        cache = SemanticCache(embed=openai_embedder())           # + similar prompts
+        cache = SemanticCache(path=DEFAULT_CACHE_PATH)           # persist across runs
+        agent = Agent("assistant", tools=[search], cache=cache)
+    """
+
+    def __init__(
+        self,
+        capacity: int = 1024,
+        threshold: float = 0.92,
+        embed: Optional[Callable[[str], Sequence[float]]] = None,
+        path: Optional[Union[str, Path]] = None
+    ):
+        """Initialize cache.
+
+        Args:
+            capacity: Maximum number of entries before least recently used are evicted
+            threshold: Minimum cosine similarity for a semantic hit
+            embed: Optional function mapping text to an embedding vector (enables semantic tier)
+            path: Optional .npz file to load from and persist to (requires numpy)
+        """
+        self.capacity = capacity
+        self.threshold = threshold
+        self.embed = embed if NUMPY_AVAILABLE else None
+        self.path = Path(path) if path and NUMPY_AVAILABLE else None
+
+        # (namespace, prompt) -> response, ordered from least to most recently used
+        self._entries: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+
+        # Preallocated unit-length float32 rows; _rows[i] is the key stored in row i (None = free slot)
+        self._embeddings = None
+        self._rows: List[Optional[Tuple[str, str]]] = []
+        self._row_of: Dict[Tuple[str, str], int] = {}
+        self._free_rows: List[int] = []
+        # Per-row namespace id (-1 for free rows) so lookup masks other namespaces in one vector op
+        self._row_namespaces = None
+        self._namespace_ids: Dict[str, int] = {}
+        # Query vectors of recent semantic misses, reused by put() so a new prompt is embedded once
+        self._miss_vectors: "OrderedDict[Tuple[str, str], object]" = OrderedDict()
+
+        # Agent.input_batch() may look up and store from several threads
+        self._lock = threading.Lock()
+
+        if self.path and self.path.exists():
+            try:
+                self._load()
+            except Exception as e:
+                # A bad file must not stop the agent; start empty and overwrite it on the next put
+                warnings.warn(f"Ignoring unreadable cache file {self.path}: {e}", RuntimeWarning)
+                self._reset()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, prompt: str, namespace: str = "") -> Optional[str]:
+        """Return a cached response for prompt, or None on miss."""
+        key = (namespace, prompt)
+
+        # Tier 1: exact match
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+            if self.embed is None or not self._row_of:
+                return None
+
+        # Tier 2: nearest stored prompt in the same namespace (embed outside the lock)
+        query = self._normalize(self.embed(prompt))
+        with self._lock:
+            namespace_id = self._namespace_ids.get(namespace)
+            best = None
+            if namespace_id is not None and self._row_of:
+                used = len(self._rows)
+                # One BLAS gemv over all used rows, then mask rows from other namespaces / free slots
+                similarities = self._embeddings[:used] @ query
+                similarities[self._row_namespaces[:used] != namespace_id] = -np.inf
+                best = int(similarities.argmax())
+                if similarities[best] < self.threshold:
+                    best = None
+            if best is None:
+                # A miss is usually followed by put() of the same prompt; keep the vector for it
+                self._miss_vectors[key] = query
+                self._miss_vectors.move_to_end(key)
+                if len(self._miss_vectors) > _MISS_VECTORS_MAX:
+                    self._miss_vectors.popitem(last=False)
+                return None
+            match = self._rows[best]
+            self._entries.move_to_end(match)
+            return self._entries[match]
+
+    def put(self, prompt: str, response: str, namespace: str = "") -> None:
+        """Store response for prompt, evicting the least recently used entry if full."""
+        key = (namespace, prompt)
+        with self._lock:
+            if key in self._entries:
+                self._entries[key] = response
+                self._entries.move_to_end(key)
+                return
+
+        with self._lock:
+            vector = self._miss_vectors.pop(key, None)
+        if vector is None and self.embed is not None:
+            vector = self._normalize(self.embed(prompt))
+
+        with self._lock:
+            if vector is not None and key not in self._row_of:
+                self._store_row(key, vector)
+
+            self._entries[key] = response
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.capacity:
+                evicted, _ = self._entries.popitem(last=False)
+                self._free_row(evicted)
+
+            if self.path:
+                self.save()
+
+    def clear(self) -> None:
+        """Drop all entries (and the persisted file, if any)."""
+        with self._lock:
+            self._reset()
+            if self.path:
+                try:
+                    self.path.unlink(missing_ok=True)
+                except OSError as e:
+                    warnings.warn(f"Could not remove cache file {self.path}: {e}", RuntimeWarning)
+
+    def save(self) -> None:
+        """Write entries and embeddings to self.path as .npz (no pickle).
+
+        Best-effort: a failed write only warns, since the answer being cached is already computed.
+        """
+        if not self.path:
+            return
+        entries = [[ns, prompt, response] for (ns, prompt), response in self._entries.items()]
+        used = [i for i, key in enumerate(self._rows) if key is not None]
+        rows = [list(self._rows[i]) for i in used]
+        embeddings = self._embeddings[used] if used else np.empty((0, 0), dtype=np.float32)
+
+        temp_path = None
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # Write beside the target, then atomically swap it in (crashes and concurrent runs can't corrupt it)
+            with tempfile.NamedTemporaryFile(dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".tmp", delete=False) as f:
+                temp_path = f.name
+                np.savez(f, entries=np.array(_dumps(entries)), rows=np.array(_dumps(rows)), embeddings=embeddings)
+            os.replace(temp_path, self.path)
+        except Exception as e:
+            warnings.warn(f"Could not save cache to {self.path}: {e}", RuntimeWarning)
+            if temp_path is not None:
+                try:
+                    os.unlink(temp_path)
+                except OSError:
+                    pass
+
+    def _reset(self) -> None:
+        """Drop all in-memory entries and embedding rows."""
+        self._entries.clear()
+        self._embeddings = None
+        self._rows = []
+        self._row_of.clear()
+        self._free_rows = []
+        self._row_namespaces = None
+        self._namespace_ids.clear()
+        self._miss_vectors.clear()
+
+    def _load(self) -> None:
+        """Load entries and embeddings from self.path."""
+        with np.load(self.path, allow_pickle=False) as data:
+            entries = _loads(str(data["entries"]))
+            rows = _loads(str(data["rows"]))
+            embeddings = data["embeddings"]
+
+        for ns, prompt, response in entries:
+            self._entries[(ns, prompt)] = response
+
+        # Embeddings are only usable when the current embed function is set
+        if self.embed is not None and rows:
+            for (ns, prompt), vector in zip(rows, embeddings.astype(np.float32)):
+                if (ns, prompt) in self._entries:
+                    self._store_row((ns, prompt), vector)
+
+    def _store_row(self, key: Tuple[str, str], vector) -> None:
+        """Write vector into a free row, growing the preallocated matrix when full. Caller holds the lock."""
+        if self._embeddings is None:
+            rows = min(self.capacity, _INITIAL_ROWS) or 1
+            self._embeddings = np.empty((rows, vector.shape[0]), dtype=np.float32)
+            self._row_namespaces = np.full(rows, -1, dtype=np.int32)
+
+        if self._free_rows:
+            i = self._free_rows.pop()
+            self._rows[i] = key
+        else:
+            i = len(self._rows)
+            if i == self._embeddings.shape[0]:
+                # Double (capped at capacity + 1) so puts stay amortized O(1) instead of copying per insert
+                rows = max(i + 1, min(i * 2, self.capacity + 1))
+                grown = np.empty((rows, self._embeddings.shape[1]), dtype=np.float32)
+                grown[:i] = self._embeddings
+                self._embeddings = grown
+                self._row_namespaces = np.concatenate(
+                    [self._row_namespaces, np.full(rows - i, -1, dtype=np.int32)]
+                )
+            self._rows.append(key)
+
+        self._embeddings[i] = vector
+        self._row_namespaces[i] = self._namespace_ids.setdefault(key[0], len(self._namespace_ids))
+        self._row_of[key] = i
+
+    def _free_row(self, key: Tuple[str, str]) -> None:
+        """Release the embedding row of an evicted key for reuse. Caller holds the lock."""
+        i = self._row_of.pop(key, None)
+        if i is not None:
+            self._rows[i] = None
+            self._row_namespaces[i] = -1
+            self._free_rows.append(i)
+
+    @staticmethod
+    def _normalize(vector: Sequence[float]):
+        """Convert to a unit-length float32 vector so dot product equals cosine similarity."""
+        v = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(v)
+        return v / norm if norm else v
+
+
+def _dumps(value) -> str:
+    """Serialize to JSON text, using orjson (C, several times faster) when installed."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(value).decode("utf-8")
+        except TypeError:
+            pass  # orjson rejects lone surrogates (e.g. "\ud800") that stdlib json escapes fine
+    return json.dumps(value)
+
+
+def _loads(text: str):
+    """Parse JSON text, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(text)
+        except ValueError:
+            pass  # orjson.JSONDecodeError: also raised for escaped lone surrogates written by stdlib json
+    return json.loads(text)
+
+
+def make_namespace(*parts: str) -> str:
+    """Hash arbitrary context strings into a short, stable namespace key."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()[:16]
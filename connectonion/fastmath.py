@@ -0,0 +1,140 @@
+"""
+Purpose: Optional Numba-compiled fast path for pure-arithmetic expressions used by calculator tools
+LLM-Note:
+  Dependencies: imports from [ast, functools, threading, collections, typing, numba (optional)] | imported by [examples/quick_start.py, user calculator tools] | tested by [tests/unit/test_fastmath.py]
+  Data flow: calculator tool calls should_jit(expression) → rejects expressions whose float64 result could differ from Python's (int constants, **) → counts calls per expression → True once expression is long (> JIT_MIN_LENGTH chars) or hot (> JIT_MIN_CALLS calls) → jit_expr(expression) → parse_expression() validates AST → constants lifted into arguments to get the expression "shape" (e.g. "a0 * a1") → one numba.njit function per shape → returns zero-arg callable bound to this expression's constants
+  State/Effects: memoizes parsed expressions, compiled shapes and bound callables in lru_caches | keeps per-expression call counts in a bounded LRU (_CALL_COUNTS_MAX) | no file I/O
+  Integration: exposes parse_expression(expression), is_jit_safe(tree), jit_expr(expression), should_jit(expression), NUMBA_AVAILABLE, JIT_MIN_LENGTH, JIT_MIN_CALLS | only numbers, + - * / // ** and unary +/- are accepted
+  Performance: first compile of a shape costs ~100ms+ (JIT flagfall) so short, rarely used expressions should stay on an interpreter | expressions sharing a shape ("42 * 17", "3 * 5") reuse one compiled function | results are floats (constants are passed as float64), so should_jit() only picks expressions that are already pure float arithmetic
+  Errors: raises ImportError from jit_expr() if numba is not installed | raises ValueError for unsupported syntax | raises SyntaxError for unparsable input | ZeroDivisionError bubbles up from compiled code
+"""
+
+import ast
+import functools
+import threading
+from collections import OrderedDict
+from typing import Callable, Tuple
+
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    numba = None
+    NUMBA_AVAILABLE = False
+
+
+# Take the JIT path only when compile cost is likely to pay off
+JIT_MIN_LENGTH = 32
+JIT_MIN_CALLS = 250
+
+_ALLOWED_NODES = (
+    ast.Expression, ast.BinOp, ast.UnaryOp, ast.Constant,
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Pow, ast.UAdd, ast.USub,
+)
+
+# Only float arithmetic without ** gives bit-identical results under numba's float64:
+# ints are arbitrary precision in Python, and float ** can raise or go complex where numba returns inf/nan
+_JIT_SAFE_OPS = (ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.UAdd, ast.USub)
+
+# Per-expression call counts, bounded because expressions come from untrusted LLM output
+_CALL_COUNTS_MAX = 1024
+_call_counts: "OrderedDict[str, int]" = OrderedDict()
+_call_counts_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1024)
+def parse_expression(expression: str) -> ast.Expression:
+    """Parse an arithmetic expression and reject anything but numbers and operators.
+
+    Args:
+        expression: Expression such as "(42 * 17) / 3"
+
+    Returns:
+        Validated ast.Expression tree
+
+    Raises:
+        ValueError: If the expression uses names, calls, strings or other syntax
+    """
+    tree = ast.parse(expression, mode="eval")
+    for node in ast.walk(tree):
+        if not isinstance(node, _ALLOWED_NODES):
+            raise ValueError(f"Unsupported syntax: {type(node).__name__}")
+        if isinstance(node, ast.Constant) and (
+            isinstance(node.value, bool) or not isinstance(node.value, (int, float))
+        ):
+            raise ValueError(f"Unsupported value: {node.value!r}")
+    return tree
+
+
+def is_jit_safe(tree: ast.Expression) -> bool:
+    """True if numba returns exactly what Python would: float constants only, no **."""
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Constant) and not isinstance(node.value, float):
+            return False
+        if isinstance(node, (ast.BinOp, ast.UnaryOp)) and not isinstance(node.op, _JIT_SAFE_OPS):
+            return False
+    return True
+
+
+def should_jit(expression: str) -> bool:
+    """Record a call and decide whether expression is worth compiling.
+
+    Returns:
+        True if numba is installed, the compiled result is identical to Python's
+        (see is_jit_safe) and the expression is long or frequently evaluated
+    """
+    if not NUMBA_AVAILABLE:
+        return False
+    try:
+        if not is_jit_safe(parse_expression(expression)):
+            return False
+    except (SyntaxError, ValueError):
+        return False  # let the caller's interpreter path report the error
+    with _call_counts_lock:
+        calls = _call_counts.pop(expression, 0) + 1
+        _call_counts[expression] = calls
+        if len(_call_counts) > _CALL_COUNTS_MAX:
+            _call_counts.popitem(last=False)
+    return len(expression) > JIT_MIN_LENGTH or calls > JIT_MIN_CALLS
+
+
+@functools.lru_cache(maxsize=1024)
+def jit_expr(expression: str) -> Callable[[], float]:
+    """Compile expression with numba and return a zero-argument callable.
+
+    Example:
+        >>> jit_expr("42 * 17")()
+        714.0
+
+    Raises:
+        ImportError: If numba is not installed
+        ValueError: If the expression is not pure arithmetic
+    """
+    if not NUMBA_AVAILABLE:
+        raise ImportError("numba is required for jit_expr. Please run: pip install numba")
+
+    shape, constants = _lift_constants(parse_expression(expression))
+    return functools.partial(_compile_shape(shape, len(constants)), *constants)
+
+
+def _lift_constants(tree: ast.Expression) -> Tuple[str, Tuple[float, ...]]:
+    """Replace numeric constants with arguments a0..aN so similar expressions share one compiled function."""
+    constants = []
+
+    class _Lift(ast.NodeTransformer):
+        def visit_Constant(self, node):
+            constants.append(float(node.value))
+            return ast.copy_location(ast.Name(id=f"a{len(constants) - 1}", ctx=ast.Load()), node)
+
+    lifted = _Lift().visit(ast.parse(ast.unparse(tree), mode="eval"))
+    return ast.unparse(lifted), tuple(constants)
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_shape(shape: str, arg_count: int) -> Callable[..., float]:
+    """Generate and njit-compile `def f(a0, ..., aN): return <shape>` once per shape."""
+    args = ", ".join(f"a{i}" for i in range(arg_count))
+    namespace = {}
+    exec(f"def f({args}):\n    return {shape}\n", {"__builtins__": {}}, namespace)
+    # Functions built with exec() have no source file, so numba's on-disk cache cannot be used
+    return numba.njit(namespace["f"])
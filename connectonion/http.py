@@ -0,0 +1,67 @@
+"""
+Purpose: Share one pooled HTTP client across every OpenAI-compatible LLM client in the process
+LLM-Note:
+  Dependencies: imports from [atexit, threading, httpx, openai, h2 (optional)] | imported by [llm.py] | tested by [tests/unit/test_http.py]
+  Data flow: OpenAILLM / GeminiLLM / OpenOnionLLM.__init__ → get_shared_client() → returns process-wide _SharedHttpClient (an openai.DefaultHttpxClient, created on first call) → passed as http_client= to openai.OpenAI
+  State/Effects: holds one module-level HTTP client guarded by a lock | close_shared_client() runs at interpreter exit | no file I/O
+  Integration: exposes get_shared_client(), close_shared_client(), HTTP2_AVAILABLE | every Agent in a process reuses the same connection pool, so repeated calls skip TCP + TLS handshakes | HTTP/2 multiplexing is used only when h2 is installed (pip install h2) | built from the SDK's own DefaultHttpxClient so it always matches the httpx package openai was built against (AnthropicLLM keeps its own client for the same reason)
+  Performance: connection reuse saves a TLS handshake (~100ms cold) per new Agent/LLM | pool limits are the SDK defaults | timeout is openai.DEFAULT_TIMEOUT (5s connect / 600s read), which openai.OpenAI adopts from the http_client
+  Errors: llm.client.close() / `with llm.client:` do not close the shared pool (close() is a no-op so other LLMs keep working) | only close_shared_client() really closes it; the next get_shared_client() call then builds a fresh one
+"""
+
+import atexit
+import threading
+
+import httpx
+import openai
+
+try:
+    import h2  # noqa: F401  (httpx needs it for http2=True)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+# DefaultHttpxClient (openai>=1.17) keeps the SDK's pool limits and redirect handling
+_BaseClient = getattr(openai, "DefaultHttpxClient", None) or httpx.Client
+
+
+class _SharedHttpClient(_BaseClient):
+    """HTTP client owned by the process, not by any one LLM: close() and __exit__ are no-ops."""
+
+    def close(self) -> None:
+        pass
+
+    def __exit__(self, exc_type=None, exc_value=None, traceback=None) -> None:
+        pass
+
+    def shutdown(self) -> None:
+        """Really close the connection pool."""
+        super().close()
+
+
+_shared_client = None
+_shared_client_lock = threading.Lock()
+
+
+def get_shared_client() -> httpx.Client:
+    """Return the process-wide HTTP client, creating it on first use or after close_shared_client()."""
+    global _shared_client
+    with _shared_client_lock:
+        if _shared_client is None or _shared_client.is_closed:
+            # openai.OpenAI adopts the http_client's timeout, so keep the SDK default
+            # (5s connect / 600s read) or long reasoning completions would time out and retry.
+            _shared_client = _SharedHttpClient(http2=HTTP2_AVAILABLE, timeout=openai.DEFAULT_TIMEOUT)
+        return _shared_client
+
+
+def close_shared_client() -> None:
+    """Close the shared connection pool (registered to run at interpreter exit)."""
+    global _shared_client
+    with _shared_client_lock:
+        if _shared_client is not None:
+            _shared_client.shutdown()
+            _shared_client = None
+
+
+atexit.register(close_shared_client)
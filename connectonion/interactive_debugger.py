@@ -131,7 +131,8 @@ class InteractiveDebugger:
 
             return trace_entry
 
-        # Install the interceptor
+        # Install the interceptor (marked interactive so tools run one at a time)
+        tool_execution_interceptor.__interactive__ = True
         tool_executor.execute_single_tool = tool_execution_interceptor
 
     def _detach_debugger_from_tool_execution(self):
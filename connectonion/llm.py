@@ -1,11 +1,11 @@
 """
 Purpose: Unified LLM provider abstraction with factory pattern for OpenAI, Anthropic, Gemini, and OpenOnion
 LLM-Note:
-  Dependencies: imports from [abc, typing, dataclasses, json, os, openai, anthropic, google.generativeai, requests, pathlib, toml, pydantic] | imported by [agent.py, llm_do.py, conftest.py] | tested by [tests/test_llm.py, tests/test_llm_do.py, tests/test_real_*.py]
+  Dependencies: imports from [abc, typing, dataclasses, json, os, openai, anthropic, google.generativeai, requests, pathlib, toml, pydantic, http.py] | imported by [agent.py, llm_do.py, conftest.py] | tested by [tests/test_llm.py, tests/test_llm_do.py, tests/test_real_*.py]
   Data flow: Agent/llm_do calls create_llm(model, api_key) → factory routes to provider class → Provider.__init__() validates API key → Agent calls complete(messages, tools) OR structured_complete(messages, output_schema) → provider converts to native format → calls API → parses response → returns LLMResponse(content, tool_calls, raw_response) OR Pydantic model instance
-  State/Effects: reads environment variables (OPENAI_API_KEY, ANTHROPIC_API_KEY, GEMINI_API_KEY, OPENONION_API_KEY) | reads ~/.connectonion/.co/config.toml for OpenOnion auth | makes HTTP requests to LLM APIs | no caching or persistence
+  State/Effects: reads environment variables (OPENAI_API_KEY, ANTHROPIC_API_KEY, GEMINI_API_KEY, OPENONION_API_KEY) | reads ~/.connectonion/.co/config.toml for OpenOnion auth | makes HTTP requests to LLM APIs over the process-wide pooled client from http.get_shared_client() | no caching or persistence
   Integration: exposes create_llm(model, api_key), LLM abstract base class, OpenAILLM, AnthropicLLM, GeminiLLM, OpenOnionLLM, LLMResponse, ToolCall dataclasses | providers implement complete() and structured_complete() | OpenAI message format is lingua franca | tool calling uses OpenAI schema converted per-provider
-  Performance: stateless (no caching) | synchronous (no streaming) | default max_tokens=8192 for Anthropic (required) | each call hits API
+  Performance: stateless (no client-side caching) | OpenAILLM and OpenOnionLLM send prompt_cache_key (set by Agent) so requests with the same static prefix hit OpenAI's prompt cache | synchronous (no streaming) | default max_tokens=8192 for Anthropic (required) | each call hits API
   Errors: raises ValueError for missing API keys, unknown models, invalid parameters | provider-specific errors bubble up (openai.APIError, anthropic.APIError, etc.) | Pydantic ValidationError for invalid structured output
 
 Unified LLM provider abstraction layer for ConnectOnion framework.
@@ -154,6 +154,8 @@ from pathlib import Path
 import toml
 from pydantic import BaseModel
 
+from .http import get_shared_client
+
 
 @dataclass
 class ToolCall:
@@ -199,13 +201,16 @@ class LLM(ABC):
 class OpenAILLM(LLM):
     """OpenAI LLM implementation."""
     
-    def __init__(self, api_key: Optional[str] = None, model: str = "o4-mini", **kwargs):
+    def __init__(self, api_key: Optional[str] = None, model: str = "o4-mini", prompt_cache_key: Optional[str] = None, **kwargs):
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         if not self.api_key:
             raise ValueError("OpenAI API key required. Set OPENAI_API_KEY environment variable or pass api_key parameter.")
         
-        self.client = openai.OpenAI(api_key=self.api_key)
+        # Shared pooled HTTP client: new agents reuse open connections instead of new TLS handshakes
+        self.client = openai.OpenAI(api_key=self.api_key, http_client=get_shared_client())
         self.model = model
+        # Routes requests sharing a prompt prefix to the same server-side prompt cache
+        self.prompt_cache_key = prompt_cache_key
     
     def complete(self, messages: List[Dict[str, str]], tools: Optional[List[Dict[str, Any]]] = None, **kwargs) -> LLMResponse:
         """Complete a conversation with optional tool support."""
@@ -219,6 +224,9 @@ class OpenAILLM(LLM):
             api_kwargs["tools"] = [{"type": "function", "function": tool} for tool in tools]
             api_kwargs["tool_choice"] = "auto"
 
+        if self.prompt_cache_key:
+            api_kwargs["extra_body"] = {"prompt_cache_key": self.prompt_cache_key, **kwargs.get("extra_body", {})}
+
         response = self.client.chat.completions.create(**api_kwargs)
         message = response.choices[0].message
 
@@ -490,7 +498,8 @@ class GeminiLLM(LLM):
         # Use Gemini's OpenAI-compatible endpoint
         self.client = openai.OpenAI(
             api_key=self.api_key,
-            base_url="https://generativelanguage.googleapis.com/v1beta/openai/"
+            base_url="https://generativelanguage.googleapis.com/v1beta/openai/",
+            http_client=get_shared_client()
         )
         self.model = model
     
@@ -591,7 +600,7 @@ MODEL_REGISTRY = {
 class OpenOnionLLM(LLM):
     """OpenOnion managed keys LLM implementation using OpenAI-compatible API."""
 
-    def __init__(self, api_key: Optional[str] = None, model: str = "co/o4-mini", **kwargs):
+    def __init__(self, api_key: Optional[str] = None, model: str = "co/o4-mini", prompt_cache_key: Optional[str] = None, **kwargs):
         # For co/ models, api_key is actually the auth token
         self.auth_token = api_key or self._get_auth_token()
         if not self.auth_token:
@@ -614,6 +623,8 @@ class OpenOnionLLM(LLM):
 
         # Strip co/ prefix - it's only for client-side routing
         self.model = model.removeprefix("co/")
+        # co/ models are served by OpenAI behind the proxy, so the same prompt cache routing applies
+        self.prompt_cache_key = prompt_cache_key
 
         # Determine base URL for OpenAI-compatible endpoint
         if os.getenv("OPENONION_DEV") or os.getenv("ENVIRONMENT") == "development":
@@ -624,7 +635,8 @@ class OpenOnionLLM(LLM):
         # Use OpenAI client with OpenOnion endpoint
         self.client = openai.OpenAI(
             base_url=base_url,
-            api_key=self.auth_token
+            api_key=self.auth_token,
+            http_client=get_shared_client()
         )
     
     def _get_auth_token(self) -> Optional[str]:
@@ -670,6 +682,9 @@ class OpenOnionLLM(LLM):
             api_kwargs["tools"] = [{"type": "function", "function": tool} for tool in tools]
             api_kwargs["tool_choice"] = "auto"
 
+        if self.prompt_cache_key:
+            api_kwargs["extra_body"] = {"prompt_cache_key": self.prompt_cache_key, **kwargs.get("extra_body", {})}
+
         response = self.client.chat.completions.create(**api_kwargs)
         message = response.choices[0].message
 
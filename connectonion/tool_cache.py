@@ -0,0 +1,75 @@
+"""
+Purpose: Memoize results of pure tools so repeated calls with the same arguments skip execution
+LLM-Note:
+  Dependencies: imports from [json, threading, time, collections, typing] | imported by [agent.py, tool_executor.py, __init__.py] | tested by [tests/unit/test_tool_cache.py]
+  Data flow: tool_executor.execute_single_tool() → agent.tool_cache.get_or_run(tool_func, tool_args) → tool not cacheable: runs tool(**args) → cacheable: key = (tool.name, json.dumps(args, sort_keys=True)) → returns stored result if present and not expired → else runs tool, stores result, returns it
+  State/Effects: keeps results in memory (OrderedDict LRU bounded by maxsize) | guarded by a lock (parallel tool calls and input_batch() share one cache) | no file I/O
+  Integration: exposes ToolCache(maxsize, ttl), .get_or_run(tool, args), .clear(), len(cache) | tools opt in with func.cacheable = True (tool_factory copies the flag; default False) | Agent creates one per agent as agent.tool_cache
+  Performance: hits cost one json.dumps of the arguments plus a dict lookup | the tool itself is not locked, so two threads missing on the same key may both run it
+  Errors: tool exceptions propagate and are never cached | arguments that are not JSON-serializable fall back to str()
+"""
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+class ToolCache:
+    """LRU cache of tool results for tools marked cacheable.
+
+    Usage:
+        def search(query: str) -> str:
+            ...
+        search.cacheable = True
+
+        agent = Agent("assistant", tools=[search])
+        agent.tool_cache  # ToolCache shared by every call this agent makes
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: Optional[float] = None):
+        """Initialize cache.
+
+        Args:
+            maxsize: Maximum number of results before least recently used are evicted
+            ttl: Optional lifetime of a result in seconds (None = until evicted)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # (tool name, arguments json) -> (expires_at, result), ordered from least to most recently used
+        self._store: "OrderedDict[Tuple[str, str], Tuple[Optional[float], Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def get_or_run(self, tool: Callable, args: Dict[str, Any]) -> Any:
+        """Return the cached result of tool(**args), running the tool on a miss."""
+        if not getattr(tool, "cacheable", False):
+            return tool(**args)
+
+        key = (getattr(tool, "name", tool.__name__), json.dumps(args, sort_keys=True, default=str))
+        with self._lock:
+            entry = self._store.get(key)
+            if entry is not None:
+                expires_at, result = entry
+                if expires_at is None or expires_at > time.monotonic():
+                    self._store.move_to_end(key)
+                    return result
+                del self._store[key]
+
+        result = tool(**args)
+
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._store[key] = (expires_at, result)
+            self._store.move_to_end(key)
+            while len(self._store) > self.maxsize:
+                self._store.popitem(last=False)
+        return result
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        with self._lock:
+            self._store.clear()
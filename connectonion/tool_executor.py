@@ -1,16 +1,18 @@
 """
 Purpose: Execute agent tools with xray context injection, timing, error handling, and trace recording
 LLM-Note:
-  Dependencies: imports from [time, json, typing, console.py, xray.py] | imported by [agent.py] | tested by [tests/test_tool_executor.py]
-  Data flow: receives from Agent → tool_calls: List[ToolCall], tool_map: Dict[str, Callable], agent: Agent, console: Console → for each tool: injects xray context via inject_xray_context() → executes tool_func(**tool_args) → records timing and result → appends to agent.current_session['trace'] → clears xray context → adds tool result to messages
-  State/Effects: mutates agent.current_session['messages'] by appending assistant message with tool_calls and tool result messages | mutates agent.current_session['trace'] by appending tool_execution entries | calls console.print() for user feedback | calls console.print_xray_table() if @xray enabled | injects/clears xray context via thread-local storage
-  Integration: exposes execute_and_record_tools(tool_calls, tool_map, agent, console), execute_single_tool(...) | checks is_xray_enabled() on tool functions | creates trace entries with type, tool_name, arguments, call_id, result, status, timing, iteration, timestamp | status values: success, error, not_found
-  Performance: times each tool execution in milliseconds | executes tools sequentially (not parallel) | trace entry added BEFORE auto-trace so xray.trace() sees it
+  Dependencies: imports from [os, time, json, concurrent.futures, typing, console.py, xray.py] | imported by [agent.py] | tested by [tests/test_tool_executor.py]
+  Data flow: receives from Agent → tool_calls: List[ToolCall], tool_map: Dict[str, Callable], agent: Agent, console: Console → for each tool: injects xray context via inject_xray_context() → executes tool_func(**tool_args) (via agent.tool_cache.get_or_run() when the agent has one) → records timing and result → appends to agent.current_session['trace'] → clears xray context → adds tool result to messages
+  State/Effects: mutates agent.current_session['messages'] by appending assistant message with tool_calls and tool result messages | mutates agent.current_session['trace'] by appending one tool_execution entry per call (success, error and not_found alike) | calls console.print() for user feedback | calls console.print_xray_table() if @xray enabled | injects/clears xray context via thread-local storage
+  Integration: exposes execute_and_record_tools(tool_calls, tool_map, agent, console), execute_single_tool(...), execute_tools_parallel(...) | checks is_xray_enabled() on tool functions | creates trace entries with type, tool_name, arguments, call_id, result, status, timing, iteration, timestamp | status values: success, error, not_found
+  Performance: times each tool execution in milliseconds | runs multiple thread-safe tool calls from one LLM response concurrently (ThreadPoolExecutor, CONNECTONION_TOOL_CONCURRENCY workers, default 8) | tools with thread_safe=False run on the calling thread | sequential while the interactive debugger is attached | trace entry added BEFORE auto-trace so xray.trace() sees it
   Errors: catches all tool execution exceptions | wraps errors in trace_entry with error, error_type fields | returns error message to LLM for retry | prints error to console with red ✗
 """
 
+import os
 import time
 import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Dict, Any, Optional, Callable
 
 from .console import Console
@@ -40,6 +42,17 @@ def execute_and_record_tools(
     # Format and add assistant message with tool calls
     _add_assistant_message(agent.current_session['messages'], tool_calls)
 
+    # Independent tool calls run concurrently; results keep the LLM's call order
+    if _can_run_in_parallel(tool_calls, tool_map):
+        trace_entries = execute_tools_parallel(tool_calls, tool_map, agent, console)
+        for tool_call, trace_entry in zip(tool_calls, trace_entries):
+            _add_tool_result_message(
+                agent.current_session['messages'],
+                tool_call.id,
+                trace_entry["result"]
+            )
+        return
+
     # Execute each tool
     for tool_call in tool_calls:
         # Execute the tool and get trace entry
@@ -63,6 +76,55 @@ def execute_and_record_tools(
         # (before auto-trace, so it shows up in xray.trace() output)
 
 
+def execute_tools_parallel(
+    tool_calls: List,
+    tool_map: Dict[str, Callable],
+    agent: Any,
+    console: Console
+) -> List[Dict[str, Any]]:
+    """Execute tool calls concurrently and return trace entries in call order.
+
+    Tools marked thread_safe=False run on the calling thread while the
+    others run in a thread pool.
+
+    Args:
+        tool_calls: List of tool calls from LLM response
+        tool_map: Dictionary mapping tool names to callable functions
+        agent: Agent instance with current_session
+        console: Console for output (always provided by Agent)
+
+    Returns:
+        List of trace entries, one per tool call, in the same order as tool_calls
+    """
+    trace_entries: List[Optional[Dict[str, Any]]] = [None] * len(tool_calls)
+
+    with ThreadPoolExecutor(max_workers=min(_max_tool_workers(), len(tool_calls))) as pool:
+        futures = {}
+        for i, tool_call in enumerate(tool_calls):
+            if _is_thread_safe(tool_map.get(tool_call.name)):
+                futures[pool.submit(
+                    execute_single_tool,
+                    tool_call.name, tool_call.arguments, tool_call.id, tool_map, agent, console
+                )] = i
+
+        # Stateful tools stay on the calling thread
+        for i, tool_call in enumerate(tool_calls):
+            if not _is_thread_safe(tool_map.get(tool_call.name)):
+                trace_entries[i] = execute_single_tool(
+                    tool_call.name, tool_call.arguments, tool_call.id, tool_map, agent, console
+                )
+
+        for future in as_completed(futures):
+            i = futures[future]
+            try:
+                trace_entries[i] = future.result()
+            except Exception as e:
+                trace_entries[i] = _error_trace_entry(tool_calls[i], e, agent)
+                agent.current_session['trace'].append(trace_entries[i])
+
+    return trace_entries
+
+
 def execute_single_tool(
     tool_name: str,
     tool_args: Dict,
@@ -113,6 +175,9 @@ def execute_single_tool(
         trace_entry["status"] = "not_found"
         trace_entry["error"] = error_msg
 
+        # Record failed calls too, so the agent can tell the turn used an unavailable tool
+        agent.current_session['trace'].append(trace_entry)
+
         # Console output
         console.print(f"[red]✗[/red] {error_msg}")
 
@@ -142,8 +207,9 @@ def execute_single_tool(
     # Execute the tool with timing
     tool_start = time.time()
     try:
-        # Execute the tool
-        result = tool_func(**tool_args)
+        # Execute the tool (cacheable tools may be served from the agent's tool cache)
+        tool_cache = getattr(agent, 'tool_cache', None)
+        result = tool_cache.get_or_run(tool_func, tool_args) if tool_cache is not None else tool_func(**tool_args)
         tool_duration = (time.time() - tool_start) * 1000  # milliseconds
 
         # Update trace entry
@@ -183,6 +249,7 @@ def execute_single_tool(
 
         error_msg = f"Error executing tool: {str(e)}"
         trace_entry["result"] = error_msg
+        agent.current_session['trace'].append(trace_entry)
 
         # Console output
         time_str = f"{tool_duration/1000:.4f}s" if tool_duration < 100 else f"{tool_duration/1000:.1f}s"
@@ -195,6 +262,46 @@ def execute_single_tool(
     return trace_entry
 
 
+def _max_tool_workers() -> int:
+    """Thread pool size for concurrent tool calls (CONNECTONION_TOOL_CONCURRENCY, default 8)."""
+    return int(os.getenv('CONNECTONION_TOOL_CONCURRENCY', '8'))
+
+
+def _is_thread_safe(tool: Optional[Callable]) -> bool:
+    """Tools are thread-safe unless they set thread_safe = False (unknown tools just report not_found)."""
+    return getattr(tool, 'thread_safe', True)
+
+
+def _can_run_in_parallel(tool_calls: List, tool_map: Dict[str, Callable]) -> bool:
+    """Check whether a batch of tool calls is worth running concurrently."""
+    if len(tool_calls) < 2 or _max_tool_workers() < 2:
+        return False
+
+    # The interactive debugger pauses inside tool execution, one tool at a time
+    if getattr(execute_single_tool, '__interactive__', False):
+        return False
+
+    thread_safe_calls = sum(1 for tc in tool_calls if _is_thread_safe(tool_map.get(tc.name)))
+    return thread_safe_calls >= 2
+
+
+def _error_trace_entry(tool_call: Any, error: Exception, agent: Any) -> Dict[str, Any]:
+    """Build an error trace entry for a tool call that failed outside the tool itself."""
+    return {
+        "type": "tool_execution",
+        "tool_name": tool_call.name,
+        "arguments": tool_call.arguments,
+        "call_id": tool_call.id,
+        "timing": 0,
+        "status": "error",
+        "result": f"Error executing tool: {str(error)}",
+        "error": str(error),
+        "error_type": type(error).__name__,
+        "iteration": agent.current_session['iteration'],
+        "timestamp": time.time()
+    }
+
+
 def _add_assistant_message(messages: List[Dict], tool_calls: List) -> None:
     """Format and add assistant message with tool calls.
 
@@ -2,10 +2,10 @@
 Purpose: Convert Python functions and class methods into agent-compatible tool schemas
 LLM-Note:
   Dependencies: imports from [inspect, functools, typing] | imported by [agent.py, __init__.py] | tested by [tests/test_tool_factory.py]
-  Data flow: receives func: Callable → inspects signature with inspect.signature() → extracts type hints with get_type_hints() → maps Python types to JSON Schema via TYPE_MAP → creates tool with .name, .description, .to_function_schema(), .run() attributes → returns wrapped Callable
+  Data flow: receives func: Callable → inspects signature with inspect.signature() → extracts type hints with get_type_hints() → maps Python types to JSON Schema via TYPE_MAP → creates tool with .name, .description, .to_function_schema(), .run(), .thread_safe, .cacheable attributes → returns wrapped Callable
   State/Effects: no side effects | pure function transformations | preserves @xray and @replay decorator flags via hasattr checks | creates wrapper functions for bound methods to maintain self reference
   Integration: exposes create_tool_from_function(func), extract_methods_from_instance(obj), is_class_instance(obj) | used by Agent.__init__ to auto-convert tools | supports both standalone functions and bound methods | skips private methods (starting with _)
-  Performance: uses inspect module (relatively fast) | TYPE_MAP provides O(1) type lookups | caches nothing (recreates on each call)
+  Performance: uses inspect module (relatively fast) | TYPE_MAP provides O(1) type lookups | schema dict built once per tool (to_function_schema() returns the same read-only dict)
   Errors: skips methods without type annotations | skips methods without return type hint | handles inspection failures gracefully | wraps functions with functools.wraps to preserve metadata
 """
 
@@ -89,13 +89,25 @@ def create_tool_from_function(func: Callable) -> Callable:
     # Attach the necessary attributes for Agent compatibility
     tool_func.name = name
     tool_func.description = description
-    tool_func.get_parameters_schema = lambda: parameters_schema
-    tool_func.to_function_schema = lambda: {
+    # Schema is built once per tool; callers must treat it as read-only
+    function_schema = {
         "name": name,
         "description": description,
         "parameters": parameters_schema,
     }
+    tool_func.get_parameters_schema = lambda: parameters_schema
+    tool_func.to_function_schema = lambda: function_schema
     tool_func.run = tool_func  # The agent calls .run() - this should be the decorated function
+
+    # Plain functions may run in parallel unless they opt out (func.thread_safe = False).
+    # Methods share instance state, so they only run in parallel if the class opts in.
+    if inspect.ismethod(func):
+        tool_func.thread_safe = getattr(func.__self__, "thread_safe", False)
+    else:
+        tool_func.thread_safe = getattr(func, "thread_safe", True)
+
+    # Results are only memoized by the agent's ToolCache when the tool opts in (func.cacheable = True)
+    tool_func.cacheable = getattr(func, "cacheable", False)
     
     return tool_func
 
@@ -1,7 +1,7 @@
 """
 Purpose: Provide runtime debugging context and visual trace for AI agent tool execution
 LLM-Note:
-  Dependencies: imports from [inspect, builtins, typing] | imported by [tool_executor.py, __init__.py] | tested by [tests/test_xray_class.py, tests/test_xray_without_decorator.py, tests/test_xray_auto_trace.py]
+  Dependencies: imports from [inspect, builtins, threading, typing] | imported by [tool_executor.py, __init__.py] | tested by [tests/test_xray_class.py, tests/test_xray_without_decorator.py, tests/test_xray_auto_trace.py]
   Data flow: receives from tool_executor → inject_xray_context(agent, user_prompt, messages, iteration, previous_tools) → stores in builtins.xray global → tool accesses xray.agent, xray.task, etc. → tool calls xray.trace() to display formatted execution history → clear_xray_context() after execution
   State/Effects: modifies builtins namespace by injecting global 'xray' object | stores thread-local context in XrayDecorator instance (_agent, _user_prompt, _messages, _iteration, _previous_tools) | clears context after tool execution | no file I/O or persistence
   Integration: exposes @xray decorator, xray global object with .agent, .task, .user_prompt, .messages, .iteration, .previous_tools properties, .trace() method | inject_xray_context(), clear_xray_context(), is_xray_enabled() helper functions | tool_executor checks __xray_enabled__ attribute to auto-print Rich tables
@@ -26,9 +26,28 @@ Usage:
 
 import inspect
 import builtins
+import threading
 from typing import Any, Callable, Optional
 
 
+class _ThreadLocalField:
+    """Per-thread attribute, so tools running in parallel each see their own context."""
+
+    def __init__(self, default_factory: Callable[[], Any] = lambda: None):
+        self.default_factory = default_factory
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        return getattr(obj._local, self.name, self.default_factory())
+
+    def __set__(self, obj, value):
+        setattr(obj._local, self.name, value)
+
+
 class XrayDecorator:
     """
     Simple xray decorator that provides context access and auto-tracing.
@@ -45,9 +64,16 @@ class XrayDecorator:
             return result
     """
 
+    # Context is stored per thread (tool_executor may run tools concurrently)
+    _agent = _ThreadLocalField()
+    _user_prompt = _ThreadLocalField()
+    _messages = _ThreadLocalField(list)
+    _iteration = _ThreadLocalField()
+    _previous_tools = _ThreadLocalField(list)
+
     def __init__(self):
         """Initialize with empty context."""
-        # Store context directly (no wrapper class needed)
+        self._local = threading.local()
         self._agent = None
         self._user_prompt = None
         self._messages = []
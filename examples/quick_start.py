@@ -1,16 +1,18 @@
 """Quick start example for ConnectOnion - minimal setup."""
 
-import os
 import sys
-from dotenv import load_dotenv
+import functools
+from pathlib import Path
 
-# Load environment variables from .env file
-load_dotenv()
+# Use the installed package if available, otherwise fall back to the repo checkout
+try:
+    import connectonion
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-# Add parent directory to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from connectonion import Agent
+from connectonion import Agent, SemanticCache
+from connectonion.cache import DEFAULT_CACHE_PATH
+from connectonion.fastmath import jit_expr, parse_expression, should_jit
 
 
 # Step 1: Define your tools (just regular functions!)
@@ -18,18 +20,36 @@ def search(query: str) -> str:
     """Search for information."""
     return f"Search results for '{query}': Found relevant information about {query}."
 
+# Same query, same answer: let the agent reuse results instead of re-running the tool
+search.cacheable = True
+
+# Deletes every allowed character; anything left over is invalid (one C-level pass)
+_REMOVE_ALLOWED = str.maketrans("", "", "0123456789+-*/(). ")
+
+
+@functools.lru_cache(maxsize=256)
+def _co(expression: str):
+    """Validate and compile an expression once; agents often retry the same one."""
+    # parse_expression() rejects anything but numbers and arithmetic operators
+    return compile(parse_expression(expression), "<calc>", "eval")
+
+
 def calculate(expression: str) -> float:
     """Do math calculations."""
     try:
-        # Safe evaluation for demo purposes
-        allowed_chars = "0123456789+-*/(). "
-        if all(c in allowed_chars for c in expression):
-            return eval(expression)
-        else:
+        # Cheap reject for untrusted input before parsing
+        if expression.translate(_REMOVE_ALLOWED):
             raise ValueError("Invalid characters in expression")
+        # Long or hot pure-float expressions go through numba (if installed); ints and ** stay exact on the interpreter
+        if should_jit(expression):
+            return jit_expr(expression)()
+        # Validated bytecode with no builtins, cached per expression
+        return eval(_co(expression), {"__builtins__": {}}, {})
     except Exception as e:
         raise Exception(f"Math error: {str(e)}")
 
+calculate.cacheable = True
+
 def get_time() -> str:
     """Get current time."""
     from datetime import datetime
@@ -45,7 +65,8 @@ def main():
         name="my_assistant",
         system_prompt="You are a friendly and helpful assistant. Be concise but warm in your responses.",
         tools=[search, calculate, get_time],
-        max_iterations=10  # Default - agent can try up to 10 tool calls per task
+        max_iterations=10,  # Default - agent can try up to 10 tool calls per task
+        cache=SemanticCache(path=DEFAULT_CACHE_PATH)  # Re-runs answer instantly from ~/.connectonion/cache.npz
     )
     
     print(f"✅ Agent created with tools: {agent.list_tools()}")
@@ -53,17 +74,15 @@ def main():
     # Step 3: Use it!
     print("\n📝 Examples:")
     
-    # Simple conversation
-    result = agent.input("Hello! What can you help me with?")
-    print(f"\n1. Greeting: {result}")
-    
-    # Math calculation
-    result = agent.input("What is 42 * 17?")
-    print(f"\n2. Math: {result}")
-    
-    # Multiple tools in one request
-    result = agent.input("Search for AI news and tell me what time it is")
-    print(f"\n3. Multiple tools: {result}")
+    # Independent prompts run concurrently, each in its own session
+    greeting, math, multi = agent.input_batch([
+        "Hello! What can you help me with?",          # Simple conversation
+        "What is 42 * 17?",                           # Math calculation
+        "Search for AI news and tell me what time it is",  # Multiple tools in one request
+    ])
+    print(f"\n1. Greeting: {greeting}")
+    print(f"\n2. Math: {math}")
+    print(f"\n3. Multiple tools: {multi}")
     
     # Example 4: Demonstrate iteration control
     print("\n4️⃣ Iteration Control Examples:")
@@ -94,4 +113,7 @@ def main():
 
 
 if __name__ == "__main__":
+    # Load environment variables from .env file (only when run as a script)
+    from dotenv import load_dotenv
+    load_dotenv()
     main()
\ No newline at end of file
@@ -1,9 +1,22 @@
 """Setup configuration for ConnectOnion."""
 
-from setuptools import setup, find_packages
+from pathlib import Path
+from setuptools import setup
 
-with open("README.md", "r", encoding="utf-8") as fh:
-    long_description = fh.read()
+long_description = (Path(__file__).parent / "README.md").read_text(encoding="utf-8")
+
+# Explicit package list (no find_packages() tree walk, and tests/ is never shipped).
+# Add new subpackages here.
+packages = [
+    "connectonion",
+    "connectonion.cli",
+    "connectonion.cli.browser_agent",
+    "connectonion.cli.commands",
+    "connectonion.debug_agent",
+    "connectonion.debug_explainer",
+    "connectonion.execution_analyzer",
+    "connectonion.useful_tools",
+]
 
 # Core dependencies - we install everything by default for simplicity
 requirements = [
@@ -21,12 +34,18 @@ requirements = [
     "questionary>=2.0.0",  # For interactive CLI prompts (arrow key navigation)
 ]
 
-# Note: playwright is the only one we keep optional since it's large and requires browser binaries
-# Users who need browser automation can install it separately: pip install playwright
+# Note: playwright and numba are kept optional since they're large (browser binaries / LLVM); orjson is only a speedup
+# Users who need them can install extras: pip install connectonion[browser], connectonion[jit] or connectonion[fast]
 optional_deps = {
     "browser": [
         "playwright>=1.40.0",  # For browser automation (large, requires browser binaries)
     ],
+    "jit": [
+        "numba>=0.57.0",  # For connectonion.fastmath compiled arithmetic (large, LLVM-based)
+    ],
+    "fast": [
+        "orjson>=3.8.0",  # Faster JSON for SemanticCache persistence (stdlib json is used otherwise)
+    ],
 }
 
 setup(
@@ -44,7 +63,7 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/openonion/connectonion",
-    packages=find_packages(),
+    packages=packages,
     package_data={
         'connectonion.cli': [
             'docs.md',  # Include docs.md in the package
@@ -1,48 +1,56 @@
 """Pytest configuration and shared fixtures for ConnectOnion tests."""
 
+import functools
+import mmap
 import pytest
-import tempfile
-import shutil
-import json
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import Mock, MagicMock
-from connectonion import Agent
+# connectonion imports are deferred into fixtures so collection doesn't pay for them
 # No need to import tools - they're just functions
-from connectonion.llm import LLMResponse, ToolCall, OpenAILLM
 
 
 @pytest.fixture
-def temp_dir():
-    """Create a temporary directory for tests."""
-    temp_dir = tempfile.mkdtemp()
-    yield temp_dir
-    shutil.rmtree(temp_dir)
+def temp_dir(tmp_path):
+    """Temporary directory for tests (pytest's tmp_path as a str)."""
+    return str(tmp_path)
 
 
 @pytest.fixture
 def mock_openai_client():
     """Create a mock OpenAI client for testing."""
+    # MagicMock only for the client, so create() still records call args
     mock_client = MagicMock()
-    
-    # Default successful response
-    mock_response = MagicMock()
-    mock_response.choices = [MagicMock()]
-    mock_response.choices[0].message.content = "Test response"
-    mock_response.choices[0].message.tool_calls = None
-    
+
+    # Default successful response (plain attributes, no child mocks synthesized on access)
+    message = SimpleNamespace(content="Test response", tool_calls=None)
+    mock_response = SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
     mock_client.chat.completions.create.return_value = mock_response
     return mock_client
 
 
+@functools.lru_cache(maxsize=None)
+def _mock_response():
+    """Shared by every mock_llm (tool_calls is a tuple so no test can mutate it)."""
+    from connectonion.llm import LLMResponse
+    return LLMResponse(content="Mock response", tool_calls=(), raw_response=None)
+
+
 @pytest.fixture
 def mock_llm():
     """Create a mock LLM instance."""
+    mock = Mock()
+    mock.complete.return_value = _mock_response()
+    return mock
+
+
+@pytest.fixture
+def mock_llm_spec():
+    """Create a mock LLM restricted to the OpenAILLM interface (catches misspelled calls)."""
+    from connectonion.llm import OpenAILLM
     mock = Mock(spec=OpenAILLM)
-    mock.complete.return_value = LLMResponse(
-        content="Mock response",
-        tool_calls=[],
-        raw_response=None
-    )
+    mock.complete.return_value = _mock_response()
     return mock
 
 
@@ -55,6 +63,8 @@ def calculator(expression: str) -> str:
     except Exception as e:
         return f"Error: {str(e)}"
 
+calculator.cacheable = True
+
 def current_time() -> str:
     """Get the current time."""
     from datetime import datetime
@@ -70,22 +80,23 @@ def read_file(file_path: str) -> str:
     except Exception as e:
         return f"Error: {str(e)}"
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_tools():
     """Standard set of test tools."""
     return [calculator, current_time, read_file]
 
 
 @pytest.fixture
-def test_agent(temp_dir, mock_llm, sample_tools):
+def test_agent(tmp_path, mock_llm, sample_tools):
     """Create a test agent with logging to temp directory."""
+    from connectonion import Agent
     # Use temp directory for logging instead of default .co/logs/
-    log_file = Path(temp_dir) / "test_agent.log"
+    log_file = tmp_path / "test_agent.log"
     agent = Agent(name="test_agent", llm=mock_llm, tools=sample_tools, log=log_file)
     return agent
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_behavior_records():
     """Sample behavior records for testing."""
     return [
@@ -122,7 +133,7 @@ def sample_behavior_records():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_openai_responses():
     """Sample OpenAI API responses for testing."""
     return {
@@ -161,9 +172,10 @@ def sample_openai_responses():
     }
 
 
-@pytest.fixture
-def test_files(temp_dir):
-    """Create test files for ReadFile tool testing."""
+@pytest.fixture(scope="session")
+def test_files(tmp_path_factory):
+    """Create test files for ReadFile tool testing (read-only, shared by all tests)."""
+    temp_dir = tmp_path_factory.mktemp("files", numbered=False)
     files = {}
     
     # Normal text file
@@ -178,8 +190,7 @@ def test_files(temp_dir):
     
     # Large file
     large_file = Path(temp_dir) / "large.txt"
-    large_content = "Line {}\n" * 10000
-    large_file.write_text(large_content.format(*range(10000)))
+    large_file.write_text("".join(f"Line {i}\n" for i in range(10000)))
     files["large"] = str(large_file)
     
     # Unicode file
@@ -190,7 +201,24 @@ def test_files(temp_dir):
     return files
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def large_file_lines(test_files):
+    """Memory-map test_files["large"] and count its lines in one C-level scan.
+
+    Yields (path, num_lines, mm); tests that need line offsets use mm.find() on the map.
+    """
+    path = test_files["large"]
+    with open(path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        # mmap has no count(); one slice copy lets bytes.count() do a single memchr scan in C
+        # (a Python-level mm.find() loop is ~30x slower on this file than copying 88KB)
+        yield path, mm[:].count(b"\n"), mm
+    finally:
+        mm.close()
+
+
+@pytest.fixture(scope="session")
 def openai_api_key():
     """Provide test API key."""
     return "sk-test-key-for-testing-only"
@@ -12,6 +12,9 @@ def Calculator(expression: str) -> str:
     except Exception as e:
         return f"Error: {str(e)}"
 
+# Same expression, same answer (ReadFile stays uncached: file contents can change between calls)
+Calculator.cacheable = True
+
 
 def CurrentTime() -> str:
     """Get the current time."""
@@ -321,6 +321,32 @@ class TestLongRunningWorkflows:
         for i, record in enumerate(agent.history.records):
             assert record.user_prompt == f"Task {i}"
     
+    def test_large_file_read_by_tool(self, large_file_lines):
+        """Tool output for the shared 10k-line file matches the memory-mapped original."""
+        path, num_lines, mm = large_file_lines
+        assert num_lines == 10000
+
+        # Offsets of the last line, found on the map instead of splitting the file
+        last_start = mm.rfind(b"\n", 0, len(mm) - 1) + 1
+        assert mm.find(b"\n", last_start) == len(mm) - 1
+        last_line = mm[last_start:len(mm) - 1].decode()
+        assert last_line == "Line 9999"
+
+        mock_llm = Mock()
+        mock_llm.complete.side_effect = [
+            LLMResponseBuilder.tool_call_response("ReadFile", {"filepath": path}),
+            LLMResponseBuilder.text_response("I've read the large file successfully.")
+        ]
+        agent = Agent(name="large_file_test", llm=mock_llm, tools=[ReadFile], log=False)
+        agent.input("Read the large file")
+
+        tool_result = next(
+            entry["result"] for entry in agent.current_session["trace"]
+            if entry.get("type") == "tool_execution"
+        )
+        assert tool_result.count("\n") == num_lines
+        assert tool_result.endswith(last_line + "\n")
+
     def test_large_tool_output_handling(self, temp_dir):
         """Test agent handling tools that produce large outputs."""
         # Create large file
@@ -508,5 +508,116 @@ class TestAgentWithStatefulTools(unittest.TestCase):
         self.assertEqual(schema["parameters"]["properties"]["multiplier"]["type"], "integer")
 
 
+class TestAgentInputBatch(unittest.TestCase):
+    """Test concurrent batch processing of independent prompts."""
+
+    def _echo_llm(self):
+        mock_llm = Mock()
+        mock_llm.model = "mock"
+        mock_llm.complete.side_effect = lambda messages, tools=None: LLMResponse(
+            content=f"echo: {messages[-1]['content']}", tool_calls=[], raw_response=None
+        )
+        return mock_llm
+
+    def test_input_batch_preserves_order(self):
+        """Responses come back in prompt order, each from a fresh session."""
+        agent = Agent(name="batch_agent", llm=self._echo_llm(), log=False)
+        results = agent.input_batch(["one", "two", "three"])
+        self.assertEqual(results, ["echo: one", "echo: two", "echo: three"])
+        self.assertIsNone(agent.current_session)
+
+    def test_input_batch_async(self):
+        """Async variant returns the same ordered results."""
+        import asyncio
+        agent = Agent(name="batch_agent", llm=self._echo_llm(), log=False)
+        results = asyncio.run(agent.input_batch_async(["a", "b"]))
+        self.assertEqual(results, ["echo: a", "echo: b"])
+
+    def test_input_batch_async_respects_worker_cap(self):
+        """Async variant never runs more prompts at once than input_batch() would."""
+        import asyncio
+        import threading
+        import time as time_module
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        def complete(messages, tools=None):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time_module.sleep(0.05)
+            with lock:
+                state["active"] -= 1
+            return LLMResponse(content="ok", tool_calls=[], raw_response=None)
+
+        mock_llm = Mock()
+        mock_llm.model = "mock"
+        mock_llm.complete.side_effect = complete
+        agent = Agent(name="batch_agent", llm=mock_llm, log=False)
+        with patch.dict(os.environ, {"CONNECTONION_TOOL_CONCURRENCY": "2"}):
+            results = asyncio.run(agent.input_batch_async([str(i) for i in range(6)]))
+        self.assertEqual(results, ["ok"] * 6)
+        self.assertEqual(state["peak"], 2)
+
+
+class TestPromptCacheKey(unittest.TestCase):
+    """Test that OpenAI requests carry a stable prompt_cache_key."""
+
+    @patch('connectonion.llm.openai.OpenAI')
+    def test_openai_requests_include_prompt_cache_key(self, mock_openai_class):
+        mock_client = mock_openai_class.return_value
+        mock_client.chat.completions.create.return_value.choices = [
+            Mock(message=Mock(content="hi", tool_calls=None))
+        ]
+
+        agent = Agent(name="cache_key_agent", model="gpt-4o-mini", api_key="sk-test", log=False, trust=None)
+        same = Agent(name="cache_key_agent", model="gpt-4o-mini", api_key="sk-test", log=False, trust=None)
+        self.assertTrue(agent.llm.prompt_cache_key)
+        self.assertEqual(agent.llm.prompt_cache_key, same.llm.prompt_cache_key)
+
+        agent.input("Hello")
+        kwargs = mock_client.chat.completions.create.call_args.kwargs
+        self.assertEqual(kwargs["extra_body"], {"prompt_cache_key": agent.llm.prompt_cache_key})
+        self.assertEqual(kwargs["messages"][0]["role"], "system")
+
+    @patch('connectonion.llm.openai.OpenAI')
+    def test_prompt_cache_key_follows_tool_changes(self, mock_openai_class):
+        agent = Agent(name="cache_key_agent", model="gpt-4o-mini", api_key="sk-test",
+                      tools=[calculator], log=False, trust=None)
+        original = agent.llm.prompt_cache_key
+
+        agent.add_tool(get_current_time)
+        self.assertNotEqual(agent.llm.prompt_cache_key, original)
+        self.assertEqual(agent.llm.prompt_cache_key, agent._prompt_cache_key())
+
+        agent.remove_tool("get_current_time")
+        self.assertEqual(agent.llm.prompt_cache_key, original)
+
+
+class TestFrozenToolSchemas(unittest.TestCase):
+    """Test that tool schemas are built once and refreshed when tools change."""
+
+    def test_schemas_follow_add_and_remove_tool(self):
+        mock_llm = Mock()
+        mock_llm.model = "mock"
+        mock_llm.complete.return_value = LLMResponse(content="ok", tool_calls=[], raw_response=None)
+        agent = Agent(name="schema_agent", llm=mock_llm, tools=[calculator], log=False)
+
+        agent.input("first")
+        first_tools = mock_llm.complete.call_args.kwargs["tools"]
+        self.assertEqual([t["name"] for t in first_tools], ["calculator"])
+
+        agent.add_tool(get_current_time)
+        agent.input("second")
+        self.assertEqual([t["name"] for t in mock_llm.complete.call_args.kwargs["tools"]],
+                         ["calculator", "get_current_time"])
+        self.assertIs(mock_llm.complete.call_args.kwargs["tools"][0], first_tools[0])
+
+        agent.remove_tool("calculator")
+        agent.remove_tool("get_current_time")
+        agent.input("third")
+        self.assertIsNone(mock_llm.complete.call_args.kwargs["tools"])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,259 @@
+"""Unit tests for connectonion/cache.py"""
+
+import unittest
+import tempfile
+import warnings
+from pathlib import Path
+from unittest.mock import Mock, patch
+from connectonion import Agent
+from connectonion.cache import SemanticCache, NUMPY_AVAILABLE
+from connectonion.llm import LLMResponse, ToolCall
+
+
+def fake_embed(text: str):
+    """Bag-of-letters embedding: similar strings get similar vectors."""
+    vector = [0.0] * 26
+    for c in text.lower():
+        if 'a' <= c <= 'z':
+            vector[ord(c) - ord('a')] += 1.0
+    return vector
+
+
+class TestSemanticCache(unittest.TestCase):
+    """Test exact and semantic cache tiers."""
+
+    def test_exact_hit_and_miss(self):
+        cache = SemanticCache()
+        self.assertIsNone(cache.lookup("What is 42 * 17?"))
+        cache.put("What is 42 * 17?", "714")
+        self.assertEqual(cache.lookup("What is 42 * 17?"), "714")
+
+    def test_namespaces_are_isolated(self):
+        cache = SemanticCache()
+        cache.put("hello", "from a", namespace="a")
+        self.assertIsNone(cache.lookup("hello", namespace="b"))
+
+    def test_lru_eviction(self):
+        cache = SemanticCache(capacity=2)
+        cache.put("one", "1")
+        cache.put("two", "2")
+        cache.lookup("one")  # "two" is now least recently used
+        cache.put("three", "3")
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.lookup("two"))
+        self.assertEqual(cache.lookup("one"), "1")
+
+    @unittest.skipUnless(NUMPY_AVAILABLE, "numpy not installed")
+    def test_semantic_hit(self):
+        cache = SemanticCache(threshold=0.9, embed=fake_embed)
+        cache.put("what time is it", "noon")
+        self.assertEqual(cache.lookup("What time is it?"), "noon")
+        self.assertIsNone(cache.lookup("search for python tutorials"))
+
+    @unittest.skipUnless(NUMPY_AVAILABLE, "numpy not installed")
+    def test_miss_then_put_embeds_once(self):
+        calls = []
+
+        def counting_embed(text: str):
+            calls.append(text)
+            return fake_embed(text)
+
+        cache = SemanticCache(threshold=0.9, embed=counting_embed)
+        cache.put("what time is it", "noon")
+        calls.clear()
+        self.assertIsNone(cache.lookup("zzz qqq"))
+        cache.put("zzz qqq", "sleepy")
+        self.assertEqual(calls, ["zzz qqq"])
+        self.assertEqual(cache.lookup("ZZZ qqq!"), "sleepy")
+
+    @unittest.skipUnless(NUMPY_AVAILABLE, "numpy not installed")
+    def test_evicted_rows_are_reused(self):
+        cache = SemanticCache(capacity=2, threshold=0.9, embed=fake_embed)
+        cache.put("what time is it", "noon")
+        cache.put("search for python tutorials", "results")
+        cache.put("weather in paris", "sunny")
+        self.assertEqual(len(cache._rows), 3)
+        cache.put("tell me a joke", "knock knock")
+        self.assertEqual(len(cache._rows), 3)
+        self.assertIsNone(cache.lookup("What time is it?"))
+        self.assertEqual(cache.lookup("Weather in Paris?"), "sunny")
+        self.assertEqual(cache.lookup("Tell me a joke!"), "knock knock")
+
+    @unittest.skipUnless(NUMPY_AVAILABLE, "numpy not installed")
+    def test_semantic_hit_respects_namespace(self):
+        cache = SemanticCache(threshold=0.9, embed=fake_embed)
+        cache.put("what time is it", "noon", namespace="a")
+        self.assertIsNone(cache.lookup("What time is it?", namespace="b"))
+        self.assertEqual(cache.lookup("What time is it?", namespace="a"), "noon")
+
+    @unittest.skipUnless(NUMPY_AVAILABLE, "numpy not installed")
+    def test_persistence_roundtrip(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "cache.npz"
+            cache = SemanticCache(embed=fake_embed, path=path)
+            cache.put("what time is it", "noon")
+
+            reloaded = SemanticCache(embed=fake_embed, path=path)
+            self.assertEqual(reloaded.lookup("what time is it"), "noon")
+            self.assertEqual(reloaded.lookup("What time is it?"), "noon")
+
+    @unittest.skipUnless(NUMPY_AVAILABLE, "numpy not installed")
+    def test_save_failure_only_warns(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            blocker = Path(temp_dir) / "not_a_dir"
+            blocker.write_text("")
+            cache = SemanticCache(path=blocker / "cache.npz")
+            with self.assertWarns(RuntimeWarning):
+                cache.put("hello", "world")
+            self.assertEqual(cache.lookup("hello"), "world")
+
+    @unittest.skipUnless(NUMPY_AVAILABLE, "numpy not installed")
+    def test_corrupt_file_loads_as_empty_cache(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "cache.npz"
+            path.write_bytes(b"not an npz file")
+            with self.assertWarns(RuntimeWarning):
+                cache = SemanticCache(path=path)
+            self.assertEqual(len(cache), 0)
+            cache.put("hello", "world")
+            self.assertEqual(SemanticCache(path=path).lookup("hello"), "world")
+            self.assertEqual([p.name for p in Path(temp_dir).iterdir()], ["cache.npz"])
+
+    @unittest.skipUnless(NUMPY_AVAILABLE, "numpy not installed")
+    def test_persistence_with_lone_surrogate(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "cache.npz"
+            with warnings.catch_warnings():
+                warnings.simplefilter("error")
+                SemanticCache(path=path).put("broken", "reply \ud800 text")
+            self.assertEqual(SemanticCache(path=path).lookup("broken"), "reply \ud800 text")
+
+    @unittest.skipUnless(NUMPY_AVAILABLE, "numpy not installed")
+    def test_persistence_without_orjson(self):
+        with tempfile.TemporaryDirectory() as temp_dir, patch("connectonion.cache.ORJSON_AVAILABLE", False):
+            path = Path(temp_dir) / "cache.npz"
+            SemanticCache(path=path).put("héllo", "wörld")
+            self.assertEqual(SemanticCache(path=path).lookup("héllo"), "wörld")
+
+
+class TestAgentCache(unittest.TestCase):
+    """Test Agent.input() consults the cache before calling the LLM."""
+
+    def test_cache_hit_skips_llm(self):
+        mock_llm = Mock()
+        mock_llm.model = "mock"
+        mock_llm.complete.return_value = LLMResponse(content="714", tool_calls=[], raw_response=None)
+        cache = SemanticCache()
+
+        first = Agent(name="cache_test", llm=mock_llm, log=False, cache=cache)
+        self.assertEqual(first.input("What is 42 * 17?"), "714")
+
+        second = Agent(name="cache_test", llm=mock_llm, log=False, cache=cache)
+        self.assertEqual(second.input("What is 42 * 17?"), "714")
+        self.assertEqual(mock_llm.complete.call_count, 1)
+
+    @unittest.skipUnless(NUMPY_AVAILABLE, "numpy not installed")
+    def test_unwritable_cache_path_still_returns_answer(self):
+        mock_llm = Mock()
+        mock_llm.model = "mock"
+        mock_llm.complete.return_value = LLMResponse(content="714", tool_calls=[], raw_response=None)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            blocker = Path(temp_dir) / "not_a_dir"
+            blocker.write_text("")
+            cache = SemanticCache(path=blocker / "cache.npz")
+            agent = Agent(name="cache_test", llm=mock_llm, log=False, cache=cache)
+            with self.assertWarns(RuntimeWarning):
+                self.assertEqual(agent.input("What is 42 * 17?"), "714")
+
+    def test_prior_turns_change_cache_key(self):
+        mock_llm = Mock()
+        mock_llm.model = "mock"
+        mock_llm.complete.return_value = LLMResponse(content="ok", tool_calls=[], raw_response=None)
+        cache = SemanticCache()
+
+        agent = Agent(name="cache_test", llm=mock_llm, log=False, cache=cache)
+        agent.input("And in French?")
+        agent.reset_conversation()
+        agent.input("Say hello")
+        agent.input("And in French?")
+        self.assertEqual(mock_llm.complete.call_count, 3)
+
+    def _tool_turn_llm(self, tool_name: str):
+        mock_llm = Mock()
+        mock_llm.model = "mock"
+        mock_llm.complete.side_effect = lambda *args, **kwargs: (
+            LLMResponse(content=None, tool_calls=[ToolCall(name=tool_name, arguments={}, id="call_1")], raw_response=None)
+            if mock_llm.complete.call_count % 2 == 1
+            else LLMResponse(content="It is noon", tool_calls=[], raw_response=None)
+        )
+        return mock_llm
+
+    def test_turn_with_non_cacheable_tool_is_not_stored(self):
+        def get_time() -> str:
+            """Get current time."""
+            return "noon"
+
+        mock_llm = self._tool_turn_llm("get_time")
+        cache = SemanticCache()
+        agent = Agent(name="cache_test", llm=mock_llm, tools=[get_time], log=False, cache=cache)
+        self.assertEqual(agent.input("What time is it?"), "It is noon")
+        self.assertEqual(len(cache), 0)
+
+    def test_turn_with_failing_tool_is_not_stored(self):
+        def get_time() -> str:
+            """Get current time."""
+            raise RuntimeError("clock down")
+
+        mock_llm = self._tool_turn_llm("get_time")
+        cache = SemanticCache()
+        agent = Agent(name="cache_test", llm=mock_llm, tools=[get_time], log=False, cache=cache)
+        agent.input("What time is it?")
+        self.assertEqual(len(cache), 0)
+
+    def test_turn_with_failing_cacheable_tool_is_not_stored(self):
+        def search(query: str = "") -> str:
+            """Search for information."""
+            raise RuntimeError("search backend down")
+
+        search.cacheable = True
+        mock_llm = self._tool_turn_llm("search")
+        cache = SemanticCache()
+        agent = Agent(name="cache_test", llm=mock_llm, tools=[search], log=False, cache=cache)
+        agent.input("Search for AI news")
+        self.assertEqual(len(cache), 0)
+
+    def test_turn_with_unknown_tool_is_not_stored(self):
+        mock_llm = self._tool_turn_llm("no_such_tool")
+        cache = SemanticCache()
+        agent = Agent(name="cache_test", llm=mock_llm, log=False, cache=cache)
+        agent.input("Do something")
+        self.assertEqual(len(cache), 0)
+
+    def test_turn_with_cacheable_tool_is_stored(self):
+        def search(query: str = "") -> str:
+            """Search for information."""
+            return "results"
+
+        search.cacheable = True
+        mock_llm = self._tool_turn_llm("search")
+        cache = SemanticCache()
+        agent = Agent(name="cache_test", llm=mock_llm, tools=[search], log=False, cache=cache)
+        agent.input("Search for AI news")
+        self.assertEqual(len(cache), 1)
+
+    def test_model_is_part_of_cache_key(self):
+        cache = SemanticCache()
+        llms = []
+        for model, answer in (("model-a", "from a"), ("model-b", "from b")):
+            mock_llm = Mock()
+            mock_llm.model = model
+            mock_llm.complete.return_value = LLMResponse(content=answer, tool_calls=[], raw_response=None)
+            llms.append(mock_llm)
+
+        Agent(name="cache_test", llm=llms[0], log=False, cache=cache).input("Hello")
+        self.assertEqual(Agent(name="cache_test", llm=llms[1], log=False, cache=cache).input("Hello"), "from b")
+        self.assertEqual(llms[1].complete.call_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
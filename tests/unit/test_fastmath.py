@@ -0,0 +1,84 @@
+"""Unit tests for connectonion/fastmath.py"""
+
+import importlib.util
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+from connectonion import fastmath
+from connectonion.fastmath import parse_expression, jit_expr, should_jit, NUMBA_AVAILABLE, JIT_MIN_LENGTH
+
+
+def load_quick_start():
+    """Import examples/quick_start.py as a module (it is not part of the package)."""
+    path = Path(__file__).resolve().parents[2] / "examples" / "quick_start.py"
+    spec = importlib.util.spec_from_file_location("quick_start", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestParseExpression(unittest.TestCase):
+    """Test arithmetic validation (works without numba)."""
+
+    def test_accepts_arithmetic(self):
+        parse_expression("(42 * 17) / 3 - -2 ** 2 // 1")
+
+    def test_rejects_names_calls_and_strings(self):
+        for expression in ('__import__("os")', "x + 1", "'a' * 3", "True + 1"):
+            with self.assertRaises(ValueError):
+                parse_expression(expression)
+
+
+@unittest.skipUnless(NUMBA_AVAILABLE, "numba not installed")
+class TestJitExpr(unittest.TestCase):
+    """Test the numba-compiled path."""
+
+    def test_matches_python_arithmetic(self):
+        for expression in ("42 * 17", "(1 + 2) / 4 - -3", "2 ** 10", "7 // 2"):
+            self.assertAlmostEqual(jit_expr(expression)(), float(eval(expression)))
+
+    def test_division_by_zero(self):
+        with self.assertRaises(ZeroDivisionError):
+            jit_expr("1 / 0")()
+
+    def test_long_expressions_take_jit_path(self):
+        self.assertFalse(should_jit("1.5 + 1.5"))
+        self.assertTrue(should_jit("1.5 + " * JIT_MIN_LENGTH + "1.5"))
+
+    def test_int_and_pow_expressions_stay_interpreted(self):
+        padding = " + 0" * JIT_MIN_LENGTH
+        for expression in ("12345678901234567 * 98765" + padding, "7 // 2" + padding, "2.0 ** 2000.0" + padding):
+            self.assertFalse(should_jit(expression))
+
+    def test_invalid_expressions_are_left_to_the_caller(self):
+        self.assertFalse(should_jit("__import__('os')" + " " * JIT_MIN_LENGTH))
+
+    def test_call_counts_are_bounded(self):
+        with patch.object(fastmath, "_CALL_COUNTS_MAX", 3), patch.object(fastmath, "_call_counts", fastmath.OrderedDict()):
+            for i in range(10):
+                should_jit(f"{i}.5 + 1.5")
+            self.assertEqual(len(fastmath._call_counts), 3)
+
+
+@unittest.skipUnless(NUMBA_AVAILABLE, "numba not installed")
+class TestCalculatePaths(unittest.TestCase):
+    """calculate() in quick_start must not change its answer when it switches to the JIT path."""
+
+    def test_same_value_on_both_paths(self):
+        calculate = load_quick_start().calculate
+        padding = " + 0" * JIT_MIN_LENGTH
+        float_padding = " + 0.0" * JIT_MIN_LENGTH
+        for short, long in (
+            ("12345678901234567 * 98765 + 1 - 1", "12345678901234567 * 98765 + 1 - 1" + padding),
+            ("2 ** 2000", "2 ** 2000" + padding),
+            ("7 // 2", "7 // 2" + padding),
+            ("0.1 + 0.2 * 3.0 / 7.0 - 1.5 // 0.4", "0.1 + 0.2 * 3.0 / 7.0 - 1.5 // 0.4" + float_padding),
+        ):
+            expected = eval(short)
+            result = calculate(long)
+            self.assertEqual(result, expected)
+            self.assertIs(type(result), type(expected))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+"""Unit tests for connectonion/http.py"""
+
+import unittest
+from unittest.mock import patch
+import httpx
+import openai
+from connectonion.http import get_shared_client, close_shared_client
+from connectonion.llm import OpenAILLM, GeminiLLM
+
+
+class TestSharedClient(unittest.TestCase):
+    """Test the process-wide HTTP client."""
+
+    def test_same_client_is_returned(self):
+        self.assertIs(get_shared_client(), get_shared_client())
+
+    def test_shutdown_client_is_replaced(self):
+        client = get_shared_client()
+        close_shared_client()
+        self.assertTrue(client.is_closed)
+        replacement = get_shared_client()
+        self.assertIsNot(replacement, client)
+        self.assertFalse(replacement.is_closed)
+
+    def test_closing_one_llm_keeps_others_working(self):
+        first = OpenAILLM(api_key="sk-test")
+        second = OpenAILLM(api_key="sk-test")
+        first.client.close()
+        with OpenAILLM(api_key="sk-test").client:
+            pass
+        self.assertFalse(second.client._client.is_closed)
+
+        def reply(request):
+            return httpx.Response(200, json={
+                "id": "chatcmpl-1", "object": "chat.completion", "created": 0, "model": "o4-mini",
+                "choices": [{"index": 0, "finish_reason": "stop",
+                             "message": {"role": "assistant", "content": "still here"}}],
+            })
+
+        with patch.object(get_shared_client(), "_transport", httpx.MockTransport(reply)):
+            result = second.complete([{"role": "user", "content": "hi"}])
+        self.assertEqual(result.content, "still here")
+
+    def test_providers_share_one_connection_pool(self):
+        first = OpenAILLM(api_key="sk-test")
+        second = OpenAILLM(api_key="sk-test")
+        gemini = GeminiLLM(api_key="test-key")
+        self.assertIs(first.client._client, get_shared_client())
+        self.assertIs(second.client._client, get_shared_client())
+        self.assertIs(gemini.client._client, get_shared_client())
+
+    def test_sdk_default_timeout_is_kept(self):
+        self.assertEqual(OpenAILLM(api_key="sk-test").client.timeout, openai.DEFAULT_TIMEOUT)
+
+
+if __name__ == '__main__':
+    unittest.main()
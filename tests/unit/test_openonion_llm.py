@@ -27,6 +27,21 @@ class TestOpenOnionLLM:
                 assert llm.client.api_key == "mock-jwt-token"
                 assert llm.model == "gpt-4o"  # co/ prefix stripped by implementation
 
+    def test_complete_sends_prompt_cache_key(self):
+        """Agent-supplied prompt_cache_key is forwarded like OpenAILLM does."""
+        with patch.object(OpenOnionLLM, '_get_auth_token', return_value='mock-jwt-token'):
+            mock_response = MagicMock()
+            mock_response.choices = [MagicMock()]
+            mock_response.choices[0].message.content = "Test response"
+            mock_response.choices[0].message.tool_calls = None
+
+            llm = create_llm(model="co/o4-mini", prompt_cache_key="abc123")
+            assert llm.prompt_cache_key == "abc123"
+
+            with patch.object(llm.client.chat.completions, 'create', return_value=mock_response) as mock_create:
+                llm.complete([{"role": "user", "content": "test"}])
+                assert mock_create.call_args[1]['extra_body'] == {"prompt_cache_key": "abc123"}
+
     def test_initialization_development(self):
         """Test OpenOnionLLM initializes with development URL."""
         with patch.object(OpenOnionLLM, '_get_auth_token', return_value='mock-jwt-token'):
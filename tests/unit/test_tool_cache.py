@@ -0,0 +1,86 @@
+"""Unit tests for connectonion/tool_cache.py"""
+
+import unittest
+from unittest.mock import patch
+from connectonion.tool_cache import ToolCache
+from connectonion.tool_factory import create_tool_from_function
+
+
+def make_counter_tool(cacheable: bool):
+    calls = []
+
+    def lookup(query: str) -> str:
+        """Look something up."""
+        calls.append(query)
+        return f"result for {query}"
+
+    lookup.cacheable = cacheable
+    return create_tool_from_function(lookup), calls
+
+
+class TestToolCache(unittest.TestCase):
+    """Test memoization of cacheable tools."""
+
+    def test_cacheable_tool_runs_once_per_arguments(self):
+        cache = ToolCache()
+        tool, calls = make_counter_tool(cacheable=True)
+        self.assertEqual(cache.get_or_run(tool, {"query": "AI"}), "result for AI")
+        self.assertEqual(cache.get_or_run(tool, {"query": "AI"}), "result for AI")
+        cache.get_or_run(tool, {"query": "ML"})
+        self.assertEqual(calls, ["AI", "ML"])
+
+    def test_non_cacheable_tool_always_runs(self):
+        cache = ToolCache()
+        tool, calls = make_counter_tool(cacheable=False)
+        cache.get_or_run(tool, {"query": "AI"})
+        cache.get_or_run(tool, {"query": "AI"})
+        self.assertEqual(calls, ["AI", "AI"])
+        self.assertEqual(len(cache), 0)
+
+    def test_tools_default_to_not_cacheable(self):
+        def get_time() -> str:
+            """Get current time."""
+            return "noon"
+
+        self.assertFalse(create_tool_from_function(get_time).cacheable)
+
+    def test_ttl_expires_results(self):
+        cache = ToolCache(ttl=10)
+        tool, calls = make_counter_tool(cacheable=True)
+        with patch("connectonion.tool_cache.time.monotonic", return_value=100.0):
+            cache.get_or_run(tool, {"query": "AI"})
+        with patch("connectonion.tool_cache.time.monotonic", return_value=105.0):
+            cache.get_or_run(tool, {"query": "AI"})
+        with patch("connectonion.tool_cache.time.monotonic", return_value=111.0):
+            cache.get_or_run(tool, {"query": "AI"})
+        self.assertEqual(calls, ["AI", "AI"])
+
+    def test_lru_eviction(self):
+        cache = ToolCache(maxsize=1)
+        tool, calls = make_counter_tool(cacheable=True)
+        cache.get_or_run(tool, {"query": "AI"})
+        cache.get_or_run(tool, {"query": "ML"})
+        cache.get_or_run(tool, {"query": "AI"})
+        self.assertEqual(calls, ["AI", "ML", "AI"])
+        self.assertEqual(len(cache), 1)
+
+    def test_errors_are_not_cached(self):
+        cache = ToolCache()
+        calls = []
+
+        def flaky(query: str) -> str:
+            """Fail on first call."""
+            calls.append(query)
+            if len(calls) == 1:
+                raise RuntimeError("boom")
+            return "ok"
+
+        flaky.cacheable = True
+        tool = create_tool_from_function(flaky)
+        with self.assertRaises(RuntimeError):
+            cache.get_or_run(tool, {"query": "AI"})
+        self.assertEqual(cache.get_or_run(tool, {"query": "AI"}), "ok")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,9 +1,12 @@
 """Unit tests for connectonion/tool_executor.py"""
 
+import threading
+import time
 import unittest
 from unittest.mock import Mock
-from connectonion.tool_executor import execute_single_tool
+from connectonion.tool_executor import execute_single_tool, execute_and_record_tools
 from connectonion.console import Console
+from connectonion.llm import ToolCall
 
 
 class FakeAgent:
@@ -47,6 +50,44 @@ class TestToolExecutor(unittest.TestCase):
         )
         self.assertEqual(trace["status"], "not_found")
 
+    def test_parallel_results_keep_call_order(self):
+        """Concurrent tool calls still produce tool messages in call order."""
+        def slow(x: int) -> int:
+            time.sleep(0.05 * x)
+            return x
+
+        agent = FakeAgent()
+        tool_calls = [ToolCall(name="slow", arguments={"x": x}, id=f"call_{x}") for x in (3, 1, 2)]
+        start = time.time()
+        execute_and_record_tools(tool_calls, {"slow": slow}, agent, Console())
+        elapsed = time.time() - start
+
+        tool_messages = [m for m in agent.current_session["messages"] if m["role"] == "tool"]
+        self.assertEqual([m["tool_call_id"] for m in tool_messages], ["call_3", "call_1", "call_2"])
+        self.assertEqual([m["content"] for m in tool_messages], ["3", "1", "2"])
+        self.assertLess(elapsed, 0.3)  # ~max(latency), not the 0.3s sum
+
+    def test_thread_unsafe_tool_runs_on_calling_thread(self):
+        """Tools with thread_safe=False are not sent to the thread pool."""
+        threads = {}
+
+        def stateful() -> str:
+            threads["stateful"] = threading.current_thread()
+            return "ok"
+        stateful.thread_safe = False
+
+        def pure() -> str:
+            return "ok"
+
+        agent = FakeAgent()
+        tool_calls = [
+            ToolCall(name="stateful", arguments={}, id="call_1"),
+            ToolCall(name="pure", arguments={}, id="call_2"),
+            ToolCall(name="pure", arguments={}, id="call_3"),
+        ]
+        execute_and_record_tools(tool_calls, {"stateful": stateful, "pure": pure}, agent, Console())
+        self.assertIs(threads["stateful"], threading.current_thread())
+
 
 if __name__ == '__main__':
     unittest.main()